@@ -1,34 +1,47 @@
 import os
-from dotenv import load_dotenv
 
-# Load environment variables from .env file
-load_dotenv()
+# Load environment variables from a .env file, importing dotenv only when
+# one exists; production deployments set variables externally and skip
+# the module import entirely, shortening cold start
+if os.path.exists('.env'):
+    from dotenv import load_dotenv
+    load_dotenv()
 
 class Config:
-    """Base configuration class"""
-    SECRET_KEY = os.environ.get('SECRET_KEY') or 'dev-secret-key-change-in-production'
-    FLASK_APP = os.environ.get('FLASK_APP') or 'app.py'
+    """Base configuration class
+
+    The configuration classes carry only class-level attributes and are
+    used via Flask's ``from_object``, so empty ``__slots__`` keeps
+    instances dict-free and the attribute surface statically declared.
+    """
+    __slots__ = ()
+    SECRET_KEY: str = os.environ.get('SECRET_KEY') or 'dev-secret-key-change-in-production'
+    FLASK_APP: str = os.environ.get('FLASK_APP') or 'app.py'
     
 class DevelopmentConfig(Config):
     """Development configuration"""
-    DEBUG = True
-    FLASK_ENV = 'development'
+    __slots__ = ()
+    DEBUG: bool = True
+    FLASK_ENV: str = 'development'
     
 class TestingConfig(Config):
     """Testing configuration"""
-    TESTING = True
-    DEBUG = True
-    FLASK_ENV = 'testing'
+    __slots__ = ()
+    TESTING: bool = True
+    DEBUG: bool = True
+    FLASK_ENV: str = 'testing'
     
 class StagingConfig(Config):
     """Staging configuration"""
-    DEBUG = False
-    FLASK_ENV = 'staging'
+    __slots__ = ()
+    DEBUG: bool = False
+    FLASK_ENV: str = 'staging'
     
 class ProductionConfig(Config):
     """Production configuration"""
-    DEBUG = False
-    FLASK_ENV = 'production'
+    __slots__ = ()
+    DEBUG: bool = False
+    FLASK_ENV: str = 'production'
 
 # Configuration dictionary
 config = {
@@ -1,12 +1,13 @@
+import gzip
+
 import pytest
-import json
 from app import app
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def client():
     """Create a test client for the Flask application"""
-    app.config['TESTING'] = True
-    app.config['ENV'] = 'testing'
+    app.testing = True
+    app.config.update(ENV='testing')
     with app.test_client() as client:
         yield client
 
@@ -42,7 +43,7 @@ class TestHealthRoute:
     def test_health_check_json_response(self, client):
         """Test that health check returns valid JSON"""
         response = client.get('/health')
-        data = json.loads(response.data)
+        data = response.get_json()
         assert 'status' in data
         assert 'timestamp' in data
         assert 'environment' in data
@@ -61,7 +62,7 @@ class TestAPIRoutes:
         response = client.get('/api/status')
         assert response.status_code == 200
         
-        data = json.loads(response.data)
+        data = response.get_json()
         assert 'application' in data
         assert 'version' in data
         assert 'status' in data
@@ -76,7 +77,7 @@ class TestAPIRoutes:
         response = client.get('/api/info')
         assert response.status_code == 200
         
-        data = json.loads(response.data)
+        data = response.get_json()
         assert 'name' in data
         assert 'description' in data
         assert 'version' in data
@@ -96,7 +97,7 @@ class TestErrorHandlers:
         response = client.get('/nonexistent-route')
         assert response.status_code == 404
         
-        data = json.loads(response.data)
+        data = response.get_json()
         assert 'error' in data
         assert 'message' in data
         assert 'status_code' in data
@@ -118,26 +119,42 @@ class TestApplicationConfiguration:
         """Test that secret key is configured"""
         assert app_context.config['SECRET_KEY'] is not None
 
+JSON_ENDPOINTS = ['/health', '/api/status', '/api/info']
+
 class TestEndpointResponses:
     """Test cases for endpoint response formats"""
-    
-    def test_all_json_endpoints_return_valid_json(self, client):
+
+    @pytest.mark.parametrize('endpoint', JSON_ENDPOINTS)
+    def test_all_json_endpoints_return_valid_json(self, client, endpoint):
         """Test that all JSON endpoints return valid JSON"""
-        json_endpoints = ['/health', '/api/status', '/api/info']
-        
-        for endpoint in json_endpoints:
-            response = client.get(endpoint)
-            assert response.status_code == 200
-            # This will raise an exception if response is not valid JSON
-            json.loads(response.data)
-    
-    def test_json_endpoints_content_type(self, client):
-        """Test that JSON endpoints return correct content type"""
-        json_endpoints = ['/health', '/api/status', '/api/info']
-        
-        for endpoint in json_endpoints:
-            response = client.get(endpoint)
-            assert 'application/json' in response.content_type
+        response = client.get(endpoint)
+        assert response.status_code == 200
+        # get_json raises if the response is not valid JSON
+        assert response.get_json() is not None
+
+    @pytest.mark.parametrize('endpoint', JSON_ENDPOINTS)
+    def test_json_endpoints_content_type(self, client, endpoint):
+        """Test that JSON endpoints declare a JSON content type"""
+        response = client.get(endpoint)
+        assert response.is_json
+
+class TestResponseCompression:
+    """Test cases for precomputed gzip responses"""
+
+    @pytest.mark.parametrize('endpoint', ['/', '/api/info'])
+    def test_gzip_served_when_accepted(self, client, endpoint):
+        """Test that compressible endpoints honor Accept-Encoding: gzip"""
+        response = client.get(endpoint, headers={'Accept-Encoding': 'gzip'})
+        assert response.status_code == 200
+        assert response.headers.get('Content-Encoding') == 'gzip'
+        assert gzip.decompress(response.data)
+
+    @pytest.mark.parametrize('endpoint', ['/', '/api/info'])
+    def test_identity_served_by_default(self, client, endpoint):
+        """Test that responses stay uncompressed without Accept-Encoding"""
+        response = client.get(endpoint)
+        assert response.status_code == 200
+        assert response.headers.get('Content-Encoding') is None
 
 class TestApplicationSecurity:
     """Test cases for basic security measures"""